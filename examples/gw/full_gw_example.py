@@ -8,8 +8,20 @@ run.
 Based on the Bilby example: https://git.ligo.org/lscsoft/bilby
 """
 
-import bilby
-import numpy as np
+import os
+
+# Limit the threads used by OpenMP/MKL/OpenBLAS. This must happen before numpy
+# or torch are imported, otherwise the thread pools are already sized and
+# each process in the pool will try to use every core.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
+import bilby  # noqa: E402
+import numpy as np  # noqa: E402
+import torch  # noqa: E402
+
+torch.set_num_interop_threads(1)
 
 outdir = "./outdir/"
 label = "full_gw_example"
@@ -6,6 +6,7 @@ normalising flows. It is designed for applications where the Bayesian
 likelihood is computationally expensive.
 """
 
+import importlib
 import logging
 from importlib.metadata import PackageNotFoundError, version
 
@@ -16,3 +17,34 @@ except PackageNotFoundError:
     __version__ = "unknown"
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Submodules are imported on first access (PEP 562) so that importing nessai
+# does not import PyTorch unless it is needed.
+_submodules = (
+    "config",
+    "evidence",
+    "experimental",
+    "flowmodel",
+    "flows",
+    "flowsampler",
+    "gw",
+    "livepoint",
+    "model",
+    "plot",
+    "posterior",
+    "priors",
+    "proposal",
+    "reparameterisations",
+    "samplers",
+    "utils",
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_submodules))
@@ -140,6 +140,11 @@ class FlowModel:
     def optimiser(self) -> str:
         return self.training_config["optimiser"]
 
+    @property
+    def dtype(self) -> np.dtype:
+        """The numpy equivalent of the dtype used for tensors."""
+        return torch.empty(0, dtype=torch.get_default_dtype()).numpy().dtype
+
     def initialise(self):
         """
         Initialise the model and optimiser.
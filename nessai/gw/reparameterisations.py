@@ -15,6 +15,7 @@ from ..reparameterisations import (
     default_reparameterisations,
     get_reparameterisation,
 )
+from ..reparameterisations.utils import freeze_reparameterisation_defaults
 from .utils import get_distance_converter
 
 logger = logging.getLogger(__name__)
@@ -210,7 +211,7 @@ class DeltaPhaseReparameterisation(Reparameterisation):
         return x, x_prime, log_j
 
 
-default_gw = {
+_default_gw = {
     "distance": (
         DistanceReparameterisation,
         {
@@ -236,5 +237,6 @@ default_gw = {
     "delta-phase": (DeltaPhaseReparameterisation, {}),
 }
 
-
-default_gw.update(default_reparameterisations)
+_default_gw.update(default_reparameterisations)
+default_gw = freeze_reparameterisation_defaults(_default_gw)
+del _default_gw
@@ -4,7 +4,9 @@ This is the default proposal used by nessai.
 """
 
 import datetime
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import numpy as np
@@ -19,7 +21,7 @@ from ...utils import (
     compute_radius,
     get_uniform_distribution,
 )
-from ...utils.sampling import NDimensionalTruncatedGaussian
+from ...utils.sampling import NDimensionalTruncatedGaussian, draw_iter
 from ...utils.structures import get_subset_arrays
 from .base import BaseFlowProposal
 
@@ -72,6 +74,17 @@ class FlowProposal(BaseFlowProposal):
         samples. This is translated to a value for ``fuzz``.
     truncate_log_q : bool, optional
         Truncate proposals using minimum log-probability of the training data.
+    prefetch_latent_draws : bool, optional
+        If True, the next batch of samples from the latent prior is drawn in
+        a background thread whilst the current batch is being processed when
+        populating the proposal. Since the global numpy random state is shared
+        between threads, runs are not reproducible with a fixed seed when this
+        is enabled.
+    latent_dtype : str or numpy.dtype, optional
+        Floating point type used when drawing samples from the latent prior.
+        If :code:`'flow'`, the dtype used by the flow is used, e.g.
+        :code:`float32`, this avoids drawing double precision samples that
+        are then cast by the flow. If not specified, double precision is used.
     """
 
     def __init__(
@@ -89,6 +102,8 @@ class FlowProposal(BaseFlowProposal):
         min_radius=False,
         max_radius=50.0,
         compute_radius_with_all=False,
+        prefetch_latent_draws=False,
+        latent_dtype=None,
         **kwargs,
     ):
         super().__init__(
@@ -100,6 +115,8 @@ class FlowProposal(BaseFlowProposal):
 
         self._draw_func = None
         self._populate_dist = None
+        self._latent_buffer = None
+        self._latent_dtype = None
 
         self.configure_population(
             drawsize,
@@ -113,6 +130,8 @@ class FlowProposal(BaseFlowProposal):
         self.volume_fraction = volume_fraction
 
         self.compute_radius_with_all = compute_radius_with_all
+        self.prefetch_latent_draws = prefetch_latent_draws
+        self.latent_dtype = latent_dtype
         self.configure_fixed_radius(fixed_radius)
         self.configure_min_max_radius(min_radius, max_radius)
 
@@ -282,7 +301,27 @@ class FlowProposal(BaseFlowProposal):
             return r[i]
 
     def prep_latent_prior(self):
-        """Prepare the latent prior."""
+        """Prepare the latent prior.
+
+        Also allocates the buffer that is reused for the latent samples when
+        populating the proposal.
+        """
+        if self.latent_prior == "flow":
+            self._latent_dtype = None
+        elif self.latent_dtype == "flow":
+            self._latent_dtype = self.flow.dtype
+        else:
+            self._latent_dtype = self.latent_dtype
+        if self.latent_prior == "flow" or self.prefetch_latent_draws:
+            self._latent_buffer = None
+        elif (
+            self._latent_buffer is None
+            or self._latent_buffer.shape != (self.drawsize, self.dims)
+            or self._latent_buffer.dtype != np.dtype(self._latent_dtype)
+        ):
+            self._latent_buffer = np.empty(
+                (self.drawsize, self.dims), dtype=self._latent_dtype
+            )
         if self.latent_prior == "truncated_gaussian":
             self._populate_dist = NDimensionalTruncatedGaussian(
                 self.dims,
@@ -300,8 +339,21 @@ class FlowProposal(BaseFlowProposal):
                 fuzz=self.fuzz,
             )
 
-    def draw_latent_prior(self, n):
-        """Draw n samples from the latent prior."""
+    def draw_latent_prior(self, n, out=None):
+        """Draw n samples from the latent prior.
+
+        Parameters
+        ----------
+        n : int
+            Number of samples to draw.
+        out : numpy.ndarray, optional
+            Array of shape (n, dims) to write the samples to. Not supported
+            when using the flow as the latent prior.
+        """
+        if out is not None:
+            return self._draw_func(N=n, out=out)
+        if self._latent_dtype is not None:
+            return self._draw_func(N=n, dtype=self._latent_dtype)
         return self._draw_func(N=n)
 
     def backward_pass(
@@ -449,6 +501,23 @@ class FlowProposal(BaseFlowProposal):
 
         self.prep_latent_prior()
 
+        if self.prefetch_latent_draws:
+            executor = ThreadPoolExecutor(max_workers=1)
+            latent_draws = draw_iter(
+                self.draw_latent_prior, executor, self.drawsize
+            )
+        else:
+            executor = None
+            if self._latent_buffer is None:
+                draw_func = self.draw_latent_prior
+            else:
+                # Samples are only used until the next batch is drawn, so the
+                # same array can be reused
+                draw_func = partial(
+                    self.draw_latent_prior, out=self._latent_buffer
+                )
+            latent_draws = map(draw_func, itertools.repeat(self.drawsize))
+
         log_n = np.log(n_samples)
         log_n_expected = -np.inf
         n_proposed = 0
@@ -457,60 +526,68 @@ class FlowProposal(BaseFlowProposal):
         n_accepted = 0
         accept = None
 
-        while n_accepted < n_samples:
-            z = self.draw_latent_prior(self.drawsize)
-            n_proposed += z.shape[0]
-
-            x, log_q = self.backward_pass(
-                z,
-                rescale=not self.use_x_prime_prior,
-                return_unit_hypercube=self.map_to_unit_hypercube,
-            )
-            if self.truncate_log_q:
-                above_min_log_q = log_q > min_log_q
-                logger.debug(
-                    "Discarding %s samples below log_q_min",
-                    self.drawsize - above_min_log_q.sum(),
-                )
-                x, log_q = get_subset_arrays(above_min_log_q, x, log_q)
-            # Handle case where all samples are below min_log_q
-            if not len(x):
-                continue
-            log_w = self.compute_weights(x, log_q)
-
-            if self.accumulate_weights:
-                samples = np.concatenate([samples, x])
-                log_weights = np.concatenate([log_weights, log_w])
-                log_constant = max(np.nanmax(log_w), log_constant)
-                log_n_expected = logsumexp(log_weights - log_constant)
-
-                logger.debug(
-                    "Drawn %s - n expected: %s / %s",
-                    samples.size,
-                    np.exp(log_n_expected),
-                    n_samples,
+        try:
+            while n_accepted < n_samples:
+                z = next(latent_draws)
+                n_proposed += z.shape[0]
+
+                x, log_q = self.backward_pass(
+                    z,
+                    rescale=not self.use_x_prime_prior,
+                    return_unit_hypercube=self.map_to_unit_hypercube,
                 )
-
-                # Only try rejection sampling if we expected to accept enough
-                # points. In the case where we don't, we continue drawing
-                # samples
-                if log_n_expected >= log_n:
-                    log_u = np.log(np.random.rand(len(log_weights)))
-                    accept = (log_weights - log_constant) > log_u
-                    n_accepted = np.sum(accept)
-                if n_proposed > max_samples:
-                    logger.warning("Reached max samples (%s)", max_samples)
-                    break
-
-            else:
-                log_w -= log_w.max()
-                log_u = np.log(np.random.rand(len(log_w)))
-                accept = log_w > log_u
-                n_accept_batch = accept.sum()
-                m = min(n_samples - n_accepted, n_accept_batch)
-                samples[n_accepted : n_accepted + m] = x[accept][:m]
-                n_accepted += n_accept_batch
-                logger.debug("n accepted: %s / %s", n_accepted, n_samples)
+                if self.truncate_log_q:
+                    above_min_log_q = log_q > min_log_q
+                    logger.debug(
+                        "Discarding %s samples below log_q_min",
+                        self.drawsize - above_min_log_q.sum(),
+                    )
+                    x, log_q = get_subset_arrays(above_min_log_q, x, log_q)
+                # Handle case where all samples are below min_log_q
+                if not len(x):
+                    continue
+                log_w = self.compute_weights(x, log_q)
+
+                if self.accumulate_weights:
+                    samples = np.concatenate([samples, x])
+                    log_weights = np.concatenate([log_weights, log_w])
+                    log_constant = max(np.nanmax(log_w), log_constant)
+                    log_n_expected = logsumexp(log_weights - log_constant)
+
+                    logger.debug(
+                        "Drawn %s - n expected: %s / %s",
+                        samples.size,
+                        np.exp(log_n_expected),
+                        n_samples,
+                    )
+
+                    # Only try rejection sampling if we expected to accept
+                    # enough points. In the case where we don't, we continue
+                    # drawing samples
+                    if log_n_expected >= log_n:
+                        log_u = np.log(np.random.rand(len(log_weights)))
+                        accept = (log_weights - log_constant) > log_u
+                        n_accepted = np.sum(accept)
+                    if n_proposed > max_samples:
+                        logger.warning("Reached max samples (%s)", max_samples)
+                        break
+
+                else:
+                    log_w -= log_w.max()
+                    log_u = np.log(np.random.rand(len(log_w)))
+                    accept = log_w > log_u
+                    n_accept_batch = accept.sum()
+                    m = min(n_samples - n_accepted, n_accept_batch)
+                    samples[n_accepted : n_accepted + m] = x[accept][:m]
+                    n_accepted += n_accept_batch
+                    logger.debug("n accepted: %s / %s", n_accepted, n_samples)
+        finally:
+            if executor is not None:
+                # Make sure the background thread has stopped before
+                # returning, even if an error is raised, since it uses the
+                # global random state
+                latent_draws.close()
+                executor.shutdown(wait=True, cancel_futures=True)
 
         if self.accumulate_weights:
             if accept is None or len(accept) != len(samples):
@@ -564,11 +641,13 @@ class FlowProposal(BaseFlowProposal):
         self.alt_dist = None
         self._populate_dist = None
         self._draw_func = None
+        self._latent_buffer = None
         self.alt_dist = None
 
     def __getstate__(self):
         state = super().__getstate__()
         state["_draw_func"] = None
         state["_populate_dist"] = None
+        state["_latent_buffer"] = None
         state["alt_dist"] = None
         return state
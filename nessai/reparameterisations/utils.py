@@ -3,9 +3,39 @@
 Utilities for handling the reparameterisations.
 """
 
+from types import MappingProxyType
+
 from .base import Reparameterisation
 from .null import NullReparameterisation
 
+_MISSING = object()
+
+
+def freeze_reparameterisation_defaults(defaults):
+    """Get a read-only copy of a dictionary of known reparameterisations.
+
+    Both the returned mapping and the keyword arguments for each entry are
+    read-only. Mutable values within the keyword arguments (e.g. lists) are
+    not copied.
+
+    Parameters
+    ----------
+    defaults : Mapping
+        Mapping from names to tuples of the reparameterisation class and
+        keyword arguments (or None).
+
+    Returns
+    -------
+    types.MappingProxyType
+        Read-only mapping of known reparameterisations.
+    """
+    return MappingProxyType(
+        {
+            name: (rc, None if kwargs is None else MappingProxyType(kwargs))
+            for name, (rc, kwargs) in defaults.items()
+        }
+    )
+
 
 def get_reparameterisation(reparameterisation, defaults=None):
     """Function to get a reparameterisation class from a name
@@ -16,8 +46,8 @@ def get_reparameterisation(reparameterisation, defaults=None):
             :obj:`nessai.reparameterisations.Reparameterisation`
         Name of the reparameterisations to return or a class that inherits from
         :obj:`~nessai.reparameterisations.Reparameterisation`
-    defaults : dict, optional
-        Dictionary of known reparameterisations that overrides the defaults.
+    defaults : Mapping, optional
+        Mapping of known reparameterisations that overrides the defaults.
 
     Returns
     -------
@@ -31,17 +61,14 @@ def get_reparameterisation(reparameterisation, defaults=None):
 
         defaults = default_reparameterisations
     if isinstance(reparameterisation, str):
-        rc, kwargs = defaults.get(reparameterisation, (None, None))
-        if rc is None:
+        hit = defaults.get(reparameterisation, _MISSING)
+        if hit is _MISSING or hit[0] is None:
             raise ValueError(
                 f"Unknown reparameterisation: {reparameterisation}"
             )
-        else:
-            if kwargs is None:
-                kwargs = {}
-            else:
-                kwargs = kwargs.copy()
-            return rc, kwargs
+        rc, kwargs = hit
+        # Shallow copy so the returned kwargs can be modified independently
+        return rc, dict(kwargs) if kwargs else {}
     elif reparameterisation is None:
         return NullReparameterisation, {}
     elif isinstance(reparameterisation, type) and issubclass(
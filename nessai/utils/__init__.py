@@ -31,10 +31,13 @@ from .rescaling import (
 from .sampling import (
     compute_radius,
     draw_gaussian,
+    draw_multivariate_gaussian,
     draw_nsphere,
     draw_surface_nsphere,
     draw_truncated_gaussian,
+    draw_truncated_gaussian_rejection,
     draw_uniform,
+    get_xp,
 )
 from .stats import rolling_mean
 from .structures import replace_in_list
@@ -56,12 +59,15 @@ __all__ = [
     "distance",
     "distributions",
     "draw_gaussian",
+    "draw_multivariate_gaussian",
     "draw_nsphere",
     "draw_surface_nsphere",
     "draw_truncated_gaussian",
+    "draw_truncated_gaussian_rejection",
     "draw_uniform",
     "get_multivariate_normal",
     "get_uniform_distribution",
+    "get_xp",
     "hist",
     "indices",
     "inverse_rescale_minus_one_to_one",
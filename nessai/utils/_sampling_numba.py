@@ -0,0 +1,75 @@
+"""
+Numba kernels used for drawing samples.
+
+These are optional and require numba to be installed, see
+:py:func:`nessai.utils.sampling.draw_nsphere_numba` and
+:py:func:`nessai.utils.sampling.draw_truncated_gaussian_numba`.
+"""
+
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("Could not import numba, numba kernels are not available")
+else:
+    NUMBA_AVAILABLE = True
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def nsphere_core(out, u_pow, fuzz_r):
+        """Fill an array with points drawn uniformly within an n-ball.
+
+        Each row is filled with Gaussian samples which are then rescaled to
+        have radius :code:`fuzz_r * u_pow[i]`.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            Array of shape (N, dims) that is filled in-place.
+        u_pow : numpy.ndarray
+            Array of shape (N,) with uniform samples raised to the power of
+            1 / dims.
+        fuzz_r : float
+            Radius of the n-ball including the fuzz factor.
+        """
+        N, dims = out.shape
+        for i in prange(N):
+            s = 0.0
+            for j in range(dims):
+                v = np.random.standard_normal()
+                out[i, j] = v
+                s += v * v
+            inv = fuzz_r * u_pow[i] / math.sqrt(s)
+            for j in range(dims):
+                out[i, j] *= inv
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def truncated_gaussian_core(out, p):
+        """Fill an array with points with given radii and random directions.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            Array of shape (N, dims) that is filled in-place.
+        p : numpy.ndarray
+            Array of shape (N,) with the radius for each point.
+        """
+        N, dims = out.shape
+        for i in prange(N):
+            s = 0.0
+            for j in range(dims):
+                v = np.random.standard_normal()
+                out[i, j] = v
+                s += v * v
+            inv = p[i] / math.sqrt(s)
+            for j in range(dims):
+                out[i, j] *= inv
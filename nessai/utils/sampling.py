@@ -3,9 +3,16 @@
 Utilities related to drawing samples.
 """
 
+import logging
+import weakref
+from functools import lru_cache
+from typing import Optional
+
 import numpy as np
-from scipy import stats
-from scipy.special import gammaincinv
+from scipy import interpolate, stats
+from scipy.special import gammainc, gammaincinv
+
+logger = logging.getLogger(__name__)
 
 
 def compute_radius(n, q=0.95):
@@ -29,7 +36,123 @@ def compute_radius(n, q=0.95):
     return stats.chi.ppf(q, n)
 
 
-def draw_surface_nsphere(dims, r=1, N=1000):
+def get_xp(device=None):
+    """Get the array namespace to use for a given device.
+
+    The returned module can be passed as :code:`xp` to
+    :py:func:`~nessai.utils.sampling.draw_nsphere`,
+    :py:func:`~nessai.utils.sampling.draw_gaussian` and
+    :py:func:`~nessai.utils.sampling.draw_truncated_gaussian` so that samples
+    are drawn on the same device as the flow, e.g.
+    :code:`get_xp(flow_model.device)`.
+
+    Parameters
+    ----------
+    device : str or :obj:`torch.device`, optional
+        Device on which the samples will be used. If it is a CUDA device and
+        cupy is installed, cupy is returned.
+
+    Returns
+    -------
+    module
+        Either :code:`cupy` or :code:`numpy`.
+    """
+    if device is not None and str(device).startswith("cuda"):
+        try:
+            import cupy
+        except ImportError:
+            logger.debug("Could not import cupy, using numpy instead")
+        else:
+            return cupy
+    return np
+
+
+def get_rng(rng=None, xp=np):
+    """Get the random number generator to use when drawing samples.
+
+    Parameters
+    ----------
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global numpy random
+        state is used, this is the state that is seeded by the samplers.
+    xp : module, optional
+        Array namespace, either :code:`numpy` or :code:`cupy`. Determines the
+        global random state that is used if :code:`rng` is not specified.
+
+    Returns
+    -------
+    :obj:`numpy.random.Generator` or :code:`numpy.random`
+        The random number generator or the global random module.
+    """
+    if rng is None:
+        return xp.random
+    return rng
+
+
+def _seeded_rng_from_global_state():
+    """Get a generator seeded from the global numpy random state."""
+    # Limit the seed so it is valid on platforms where int is 32-bit
+    seed = np.random.randint(0, min(np.iinfo(int).max, 2**32 - 1))
+    return np.random.default_rng(seed)
+
+
+def get_jumped_rngs(n, rng=None):
+    """Get independent random number generators for parallel streams.
+
+    Each generator uses a copy of the bit generator that has been jumped
+    ahead a different number of times, so the streams do not overlap.
+
+    Parameters
+    ----------
+    n : int
+        Number of generators to return.
+    rng : :obj:`numpy.random.Generator`, optional
+        Generator used as the starting point for the streams. If not
+        specified, a new generator is seeded from the global numpy random
+        state.
+
+    Returns
+    -------
+    list
+        List of :code:`n` instances of :obj:`numpy.random.Generator`.
+    """
+    if rng is None:
+        rng = _seeded_rng_from_global_state()
+    bit_generator = rng.bit_generator
+    return [np.random.Generator(bit_generator.jumped(i + 1)) for i in range(n)]
+
+
+def _check_out_shape(out, shape):
+    """Check an output array has the expected shape."""
+    if out.shape != shape:
+        raise ValueError(
+            f"Output array has shape {out.shape}, expected {shape}"
+        )
+
+
+def _standard_normal(rng, shape, out=None, dtype=None):
+    """Draw standard normal samples, optionally writing them to an array.
+
+    If :code:`rng` is a :obj:`numpy.random.Generator`, the samples are written
+    directly into :code:`out`, otherwise they are drawn and then copied. If
+    :code:`dtype` is specified, the samples are drawn with that dtype where
+    supported.
+    """
+    if out is None:
+        if dtype is None:
+            return rng.standard_normal(shape)
+        if rng is np.random:
+            # The global numpy random state can only draw doubles
+            return rng.standard_normal(shape).astype(dtype, copy=False)
+        return rng.standard_normal(shape, dtype=dtype)
+    _check_out_shape(out, shape)
+    if isinstance(rng, np.random.Generator):
+        return rng.standard_normal(out=out, dtype=out.dtype)
+    out[...] = rng.standard_normal(shape)
+    return out
+
+
+def draw_surface_nsphere(dims, r=1, N=1000, rng=None, out=None):
     """
     Draw N points uniformly from  n-1 sphere of radius r using Marsaglia's
     algorithm. E.g for 3 dimensions returns points on a 'regular' sphere.
@@ -44,19 +167,28 @@ def draw_surface_nsphere(dims, r=1, N=1000):
         Radius of the n-sphere, if specified it is used to rescale the samples
     N : int, optional
         Number of samples to draw
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global numpy random
+        state is used.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
 
     Returns
     -------
     ndarray
         Array of samples with shape (N, dims)
     """
-    x = np.random.randn(N, dims)
-    R = np.sqrt(np.sum(x**2.0, axis=1))[:, np.newaxis]
-    z = x / R
-    return r * z
+    rng = get_rng(rng)
+    x = _standard_normal(rng, (N, dims), out=out)
+    R = np.sqrt(np.einsum("ij,ij->i", x, x))
+    np.multiply(x, (r / R)[:, np.newaxis], out=x)
+    return x
 
 
-def draw_nsphere(dims, r=1, N=1000, fuzz=1.0):
+def draw_nsphere(
+    dims, r=1, N=1000, fuzz=1.0, rng=None, xp=np, out=None, dtype=None
+):
     """
     Draw N points uniformly within an n-sphere of radius r
 
@@ -70,19 +202,43 @@ def draw_nsphere(dims, r=1, N=1000, fuzz=1.0):
         Number of samples to draw
     fuzz : float, optional
         Fuzz factor by which to increase the radius of the n-ball
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global random state
+        of :code:`xp` is used.
+    xp : module, optional
+        Array namespace used to draw the samples, either :code:`numpy` or
+        :code:`cupy`. See :py:func:`nessai.utils.sampling.get_xp`.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
+    dtype : numpy.dtype, optional
+        Floating point type of the samples, e.g. :code:`numpy.float32` to
+        match a flow that uses single precision. Defaults to
+        :code:`numpy.float64`. Ignored if :code:`out` is specified.
 
     Returns
     -------
     ndarray
         Array of samples with shape (N, dims)
     """
-    x = draw_surface_nsphere(dims, r=1, N=N)
-    R = np.random.uniform(0, 1, (N, 1))
-    z = R ** (1 / dims) * x
-    return fuzz * r * z
-
-
-def draw_uniform(dims, r=(1,), N=1000, fuzz=1.0):
+    rng = get_rng(rng, xp=xp)
+    # Same as draw_surface_nsphere but the radial and angular scalings are
+    # combined and applied in-place
+    x = _standard_normal(rng, (N, dims), out=out, dtype=dtype)
+    norm = xp.sqrt(xp.einsum("ij,ij->i", x, x))
+    # The uniform samples are not used elsewhere so the radial scaling can
+    # be computed in-place
+    u = rng.uniform(0, 1, N).astype(x.dtype, copy=False)
+    xp.power(u, 1.0 / dims, out=u)
+    u *= fuzz * r
+    u /= norm
+    xp.multiply(x, u[:, None], out=x)
+    return x
+
+
+def draw_uniform(
+    dims, r=(1,), N=1000, fuzz=1.0, rng=None, out=None, dtype=None
+):
     """
     Draw from a uniform distribution on [0, 1].
 
@@ -99,19 +255,41 @@ def draw_uniform(dims, r=(1,), N=1000, fuzz=1.0):
     fuzz : float, ignored
         Fuzz factor by which to increase the radius of the n-ball. (Ignored by
         this function)
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global numpy random
+        state is used.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
+    dtype : numpy.dtype, optional
+        Floating point type of the samples. Defaults to
+        :code:`numpy.float64`. Ignored if :code:`out` is specified.
 
     Returns
     -------
     ndarraay
         Array of samples with shape (N, dims)
     """
-    return np.random.uniform(0, 1, (N, dims))
-
-
-def draw_gaussian(dims, r=1, N=1000, fuzz=1.0):
+    rng = get_rng(rng)
+    if out is None:
+        if dtype is None:
+            return rng.uniform(0, 1, (N, dims))
+        if isinstance(rng, np.random.Generator):
+            return rng.random((N, dims), dtype=dtype)
+        return rng.uniform(0, 1, (N, dims)).astype(dtype, copy=False)
+    _check_out_shape(out, (N, dims))
+    if isinstance(rng, np.random.Generator):
+        return rng.random(out=out, dtype=out.dtype)
+    out[...] = rng.uniform(0, 1, (N, dims))
+    return out
+
+
+def draw_gaussian(
+    dims, r=1, N=1000, fuzz=1.0, rng=None, xp=np, out=None, dtype=None
+):
     """
-    Wrapper for numpy.random.randn that deals with extra input parameters
-    r and fuzz
+    Wrapper for numpy.random.standard_normal that deals with extra input
+    parameters r and fuzz
 
     Parameters
     ----------
@@ -123,16 +301,166 @@ def draw_gaussian(dims, r=1, N=1000, fuzz=1.0):
         Number of samples to draw
     fuzz : float, ignored
         Fuzz factor by which to increase the radius of the n-ball
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global random state
+        of :code:`xp` is used.
+    xp : module, optional
+        Array namespace used to draw the samples, either :code:`numpy` or
+        :code:`cupy`. See :py:func:`nessai.utils.sampling.get_xp`.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
+    dtype : numpy.dtype, optional
+        Floating point type of the samples, e.g. :code:`numpy.float32` to
+        match a flow that uses single precision. Defaults to
+        :code:`numpy.float64`. Ignored if :code:`out` is specified.
+
+    Returns
+    -------
+    ndarray
+        Array of samples with shape (N, dims)
+    """
+    return _standard_normal(
+        get_rng(rng, xp=xp), (N, dims), out=out, dtype=dtype
+    )
+
+
+_cholesky_cache = {}
+
+
+def _get_cholesky_factor(cov):
+    """Get the Cholesky factor of a covariance matrix.
+
+    The factor is cached for each covariance array and the cache entry is
+    removed when the array is garbage collected. A copy of the covariance
+    matrix is stored with the factor, so the factor is recomputed if the
+    array has been modified in-place.
+
+    Parameters
+    ----------
+    cov : array_like
+        Covariance matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        Lower-triangular Cholesky factor.
+    """
+    key = id(cov)
+    hit = _cholesky_cache.get(key)
+    # Comparing the contents is O(D^2) compared to O(D^3) for the factor
+    if hit is not None and hit[0]() is cov and np.array_equal(hit[1], cov):
+        return hit[2]
+    L = np.linalg.cholesky(cov)
+    try:
+        ref = weakref.ref(
+            cov, lambda _, key=key: _cholesky_cache.pop(key, None)
+        )
+    except TypeError:
+        # Objects such as lists cannot be cached
+        return L
+    _cholesky_cache[key] = (ref, np.array(cov, copy=True), L)
+    return L
+
+
+def draw_multivariate_gaussian(mean, cov, N=1000, rng=None, method="cholesky"):
+    """
+    Draw N points from a multivariate Gaussian.
+
+    Parameters
+    ----------
+    mean : array_like
+        Mean of the Gaussian with shape (dims,)
+    cov : array_like
+        Covariance matrix with shape (dims, dims)
+    N : int, optional
+        Number of samples to draw
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global numpy random
+        state is used.
+    method : {'cholesky', 'svd', 'eigh'}
+        Method used to factor the covariance matrix. If 'cholesky' the factor
+        is cached between calls with the same covariance array. Other methods
+        are passed to :code:`numpy.random.Generator.multivariate_normal`, if
+        :code:`rng` is not specified, a generator seeded from the global
+        numpy random state is used.
 
     Returns
     -------
     ndarray
         Array of samples with shape (N, dims)
     """
-    return np.random.randn(N, dims)
+    if method != "cholesky":
+        if rng is None:
+            # The global random state does not support the method argument
+            rng = _seeded_rng_from_global_state()
+        return rng.multivariate_normal(mean, cov, size=N, method=method)
+    rng = get_rng(rng)
+    L = _get_cholesky_factor(cov)
+    x = rng.standard_normal((N, L.shape[0])) @ L.T
+    x += mean
+    return x
+
+
+@lru_cache(maxsize=32)
+def _get_chi_ppf_interpolant(dims, r_max, n_points=1024):
+    """Get an interpolant for the inverse CDF of a chi-distribution.
+
+    The CDF is tabulated on a grid of radii using the regularized lower
+    incomplete gamma function of the squared radius and the inverse is
+    interpolated with a monotonic cubic interpolant. The grid stops where the
+    CDF saturates (or at :code:`r_max`), so large values of :code:`r_max` do
+    not reduce the resolution in the bulk of the distribution. The final node
+    is therefore placed at the smaller of :code:`r_max` and the saturation
+    radius, which also allows :code:`r_max` to be infinite. The radius is
+    interpolated as a function of :code:`u ** (1 / dims)` since the inverse
+    CDF scales as :code:`u ** (1 / dims)` for small :code:`u`. If
+    :code:`r_max` is zero, the inverse CDF is zero everywhere.
+
+    Results are cached but the cache is keyed on the exact value of
+    :code:`r_max`, so it only helps when the same radius is reused, e.g. with
+    a fixed radius or when the radius is clipped to the maximum radius.
 
+    Parameters
+    ----------
+    dims : int
+        Degrees of freedom of the chi-distribution.
+    r_max : float
+        Maximum radius.
+    n_points : int
+        Number of points used to tabulate the CDF.
 
-def draw_truncated_gaussian(dims, r, N=1000, fuzz=1.0, var=1):
+    Returns
+    -------
+    Callable
+        Interpolant for the inverse CDF.
+    float
+        Value of the CDF at :code:`r_max`.
+    """
+    if r_max == 0:
+        return np.zeros_like, 0.0
+    u_max = gammainc(dims / 2, r_max**2 / 2)
+    # Radius beyond which the CDF is one to numerical precision
+    r_end = min(r_max, np.sqrt(2 * gammaincinv(dims / 2, 1 - 1e-15)))
+    p = np.linspace(0, r_end, n_points)
+    u = gammainc(dims / 2, p**2 / 2)
+    # Points where the CDF is flat to numerical precision have negligible
+    # probability and break the interpolation
+    keep = np.concatenate([[True], np.diff(u) > 1e-12 * u_max])
+    u, p = u[keep], p[keep]
+    # Make sure the interpolant always covers [0, u_max]
+    u[-1], p[-1] = u_max, r_end
+    interpolant = interpolate.PchipInterpolator(u ** (1 / dims), p)
+
+    def ppf(x):
+        return interpolant(x ** (1 / dims))
+
+    return ppf, u_max
+
+
+def draw_truncated_gaussian(
+    dims, r, N=1000, fuzz=1.0, var=1, rng=None, xp=np, out=None, dtype=None
+):
     """
     Draw N points from a truncated gaussian with a given a radius
 
@@ -146,19 +474,298 @@ def draw_truncated_gaussian(dims, r, N=1000, fuzz=1.0, var=1):
         Number of samples to draw
     fuzz : float, ignored
         Fuzz factor by which to increase the radius of the truncated Gaussian
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global random state
+        of :code:`xp` is used.
+    xp : module, optional
+        Array namespace used to draw the samples, either :code:`numpy` or
+        :code:`cupy`. See :py:func:`nessai.utils.sampling.get_xp`.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
+    dtype : numpy.dtype, optional
+        Floating point type of the samples, e.g. :code:`numpy.float32` to
+        match a flow that uses single precision. Defaults to
+        :code:`numpy.float64`. Ignored if :code:`out` is specified.
+
+    Returns
+    -------
+    ndarray
+        Array of samples with shape (N, dims)
+    """
+    rng = get_rng(rng, xp=xp)
+    sigma = np.sqrt(var)
+    ppf, u_max = _get_chi_ppf_interpolant(dims, float(r * fuzz / sigma))
+    u = rng.uniform(0, u_max, N)
+    if xp is not np:
+        # The interpolant can only be evaluated on the host
+        p = xp.asarray(sigma * ppf(xp.asnumpy(u)))
+    else:
+        p = sigma * ppf(u)
+    x = _standard_normal(rng, (N, dims), out=out, dtype=dtype)
+    # Scale each direction in-place to avoid allocating further (N, dims)
+    # arrays
+    r2 = xp.einsum("ij,ij->i", x, x)
+    xp.multiply(x, (p / xp.sqrt(r2))[:, None], out=x)
+    return x
+
+
+@lru_cache(maxsize=32)
+def _get_truncated_gaussian_acceptance(dims, r_max):
+    """Get the probability a unit Gaussian sample lies within a radius.
+
+    This is the CDF of a chi-distribution written in terms of the squared
+    radius using the regularized lower incomplete gamma function.
+
+    Parameters
+    ----------
+    dims : int
+        Number of dimensions.
+    r_max : float
+        Radius of the truncation.
+
+    Returns
+    -------
+    float
+        Probability of a sample having a radius less than :code:`r_max`.
+    """
+    return float(gammainc(dims / 2, r_max**2 / 2))
+
+
+def draw_truncated_gaussian_rejection(
+    dims,
+    r,
+    N=1000,
+    fuzz=1.0,
+    var=1,
+    rng=None,
+    out=None,
+    dtype=None,
+    min_acceptance=0.01,
+    max_batch_size=1_000_000,
+):
+    """
+    Draw N points from a truncated gaussian using rejection sampling.
+
+    Equivalent to :py:func:`draw_truncated_gaussian` but the squared radii
+    are drawn from a chi-squared distribution and those outside the
+    truncation are rejected, the directions are then only drawn for the
+    accepted radii. This avoids evaluating the inverse CDF but the number of
+    radii that must be drawn scales with the inverse of the acceptance rate,
+    so if the acceptance rate is below :code:`min_acceptance`,
+    :py:func:`draw_truncated_gaussian` is used instead.
+
+    Parameters
+    ----------
+    dims : int
+        Dimension of the n-sphere
+    r : float
+        Radius of the truncated Gaussian
+    N : int, optional
+        Number of samples to draw
+    fuzz : float, optional
+        Fuzz factor by which to increase the radius of the truncated Gaussian
+    var : float, optional
+        Variance of the Gaussian
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator. If not specified, the global numpy random
+        state is used.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
+    dtype : numpy.dtype, optional
+        Floating point type of the samples. Defaults to
+        :code:`numpy.float64`. Ignored if :code:`out` is specified.
+    min_acceptance : float, optional
+        Minimum acceptance rate for which rejection sampling is used.
+    max_batch_size : int, optional
+        Maximum number of radii drawn in a single batch.
+
+    Returns
+    -------
+    ndarray
+        Array of samples with shape (N, dims)
+    """
+    sigma = np.sqrt(var)
+    r_max = float(r * fuzz / sigma)
+    acceptance = _get_truncated_gaussian_acceptance(dims, r_max)
+    if not acceptance > 0:
+        raise ValueError(
+            f"Acceptance rate is zero for radius {r_max} in {dims} dimensions"
+        )
+    if acceptance < min_acceptance:
+        logger.debug(
+            f"Acceptance rate ({acceptance:.3g}) is below {min_acceptance}, "
+            "using inverse CDF sampling instead"
+        )
+        return draw_truncated_gaussian(
+            dims, r, N=N, fuzz=fuzz, var=var, rng=rng, out=out, dtype=dtype
+        )
+    rng = get_rng(rng)
+    r2_max = r_max**2
+    r2 = np.empty(N)
+    n = 0
+    # Over-draw so that most of the time a single batch is sufficient,
+    # the factor is doubled for each additional batch
+    factor = 1.5
+    while n < N:
+        n_draw = min(
+            int(np.ceil(factor * (N - n) / acceptance)), max_batch_size
+        )
+        r2_draw = rng.chisquare(dims, n_draw)
+        accepted = np.compress(r2_draw <= r2_max, r2_draw)[: N - n]
+        r2[n : n + len(accepted)] = accepted
+        n += len(accepted)
+        factor *= 2
+    x = _standard_normal(rng, (N, dims), out=out, dtype=dtype)
+    # Rescale the directions to the accepted radii in-place
+    r2 /= np.einsum("ij,ij->i", x, x)
+    np.sqrt(r2, out=r2)
+    r2 *= sigma
+    np.multiply(x, r2[:, None], out=x)
+    return x
+
+
+def _get_numba_kernels():
+    """Get the numba kernels or raise an error if numba is not installed."""
+    from . import _sampling_numba
+
+    if not _sampling_numba.NUMBA_AVAILABLE:
+        raise RuntimeError(
+            "numba is not installed! Install numba in order to use the "
+            "numba sampling functions."
+        )
+    return _sampling_numba
+
+
+def draw_nsphere_numba(dims, r=1, N=1000, fuzz=1.0, rng=None, out=None):
+    """
+    Draw N points uniformly within an n-sphere of radius r using numba.
+
+    Equivalent to :py:func:`draw_nsphere` but the directions are drawn and
+    rescaled by a single parallel numba kernel. Requires numba.
+
+    Notes
+    -----
+    The Gaussian samples used for the directions are drawn using numba's
+    internal random state, this is independent of the numpy random state and
+    of :code:`rng`.
+
+    Parameters
+    ----------
+    dims : int
+        Dimension of the n-sphere
+    r : float, optional
+        Radius of the n-ball
+    N : int, optional
+        Number of samples to draw
+    fuzz : float, optional
+        Fuzz factor by which to increase the radius of the n-ball
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator used to draw the radii. If not specified, the
+        global numpy random state is used.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
+
+    Returns
+    -------
+    ndarray
+        Array of samples with shape (N, dims)
+    """
+    kernels = _get_numba_kernels()
+    u = get_rng(rng).uniform(0, 1, N)
+    if out is None:
+        out = np.empty((N, dims))
+    else:
+        _check_out_shape(out, (N, dims))
+    kernels.nsphere_core(out, np.power(u, 1.0 / dims, out=u), float(fuzz * r))
+    return out
+
+
+def draw_truncated_gaussian_numba(
+    dims, r, N=1000, fuzz=1.0, var=1, rng=None, out=None
+):
+    """
+    Draw N points from a truncated gaussian with a given a radius using numba.
+
+    Equivalent to :py:func:`draw_truncated_gaussian` but the directions are
+    drawn and rescaled by a single parallel numba kernel. Requires numba.
+
+    Notes
+    -----
+    The Gaussian samples used for the directions are drawn using numba's
+    internal random state, this is independent of the numpy random state and
+    of :code:`rng`.
+
+    Parameters
+    ----------
+    dims : int
+        Dimension of the n-sphere
+    r : float
+        Radius of the truncated Gaussian
+    N : int, optional
+        Number of samples to draw
+    fuzz : float, optional
+        Fuzz factor by which to increase the radius of the truncated Gaussian
+    var : float, optional
+        Variance of the Gaussian
+    rng : :obj:`numpy.random.Generator`, optional
+        Random number generator used to draw the radii. If not specified, the
+        global numpy random state is used.
+    out : numpy.ndarray, optional
+        Array of shape (N, dims) to write the samples to. If not specified, a
+        new array is allocated.
 
     Returns
     -------
     ndarray
         Array of samples with shape (N, dims)
     """
+    kernels = _get_numba_kernels()
     sigma = np.sqrt(var)
-    u_max = stats.chi.cdf(r * fuzz / sigma, df=dims)
-    u = np.random.uniform(0, u_max, N)
-    p = sigma * stats.chi.ppf(u, df=dims)
-    x = np.random.randn(p.size, dims)
-    points = (p * x.T / np.sqrt(np.sum(x**2.0, axis=1))).T
-    return points
+    ppf, u_max = _get_chi_ppf_interpolant(dims, float(r * fuzz / sigma))
+    u = get_rng(rng).uniform(0, u_max, N)
+    p = sigma * ppf(u)
+    if out is None:
+        out = np.empty((N, dims))
+    else:
+        _check_out_shape(out, (N, dims))
+    kernels.truncated_gaussian_core(out, p)
+    return out
+
+
+def draw_iter(draw_func, executor, *args, **kwargs):
+    """Iterate over batches of samples that are drawn in the background.
+
+    The next batch is submitted to the executor as soon as the current batch
+    is returned, so drawing samples overlaps with whatever the caller does
+    with the current batch.
+
+    Parameters
+    ----------
+    draw_func : Callable
+        Function used to draw each batch of samples.
+    executor : :obj:`concurrent.futures.Executor`
+        Executor used to draw the samples, e.g. a
+        :obj:`concurrent.futures.ThreadPoolExecutor`.
+    args :
+        Positional arguments passed to :code:`draw_func`.
+    kwargs :
+        Keyword arguments passed to :code:`draw_func`.
+
+    Yields
+    ------
+    Batches of samples returned by :code:`draw_func`.
+    """
+    future = executor.submit(draw_func, *args, **kwargs)
+    try:
+        while True:
+            samples = future.result()
+            future = executor.submit(draw_func, *args, **kwargs)
+            yield samples
+    finally:
+        future.cancel()
 
 
 class NDimensionalTruncatedGaussian:
@@ -183,26 +790,56 @@ class NDimensionalTruncatedGaussian:
         self.dims = dims
         self.radius = radius
         self.fuzz = fuzz
-        self.chi = stats.chi(df=self.dims)
+        # CDF of a chi-distribution written in terms of the squared radius,
+        # this avoids constructing a frozen scipy distribution
+        self.u_max = gammainc(
+            self.dims / 2, (self.radius * self.fuzz) ** 2 / 2
+        )
 
-        self.u_max = self.chi.cdf(self.radius * self.fuzz)
-
-    def sample(self, N: int) -> np.ndarray:
+    def sample(
+        self,
+        N: int,
+        rng: Optional[np.random.Generator] = None,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[np.dtype] = None,
+    ) -> np.ndarray:
         """Sample from the distribution.
 
         Parameters
         ----------
         n : int
             Number of samples to draw
+        rng : Optional[numpy.random.Generator]
+            Random number generator. If not specified, the global numpy
+            random state is used.
+        out : Optional[numpy.ndarray]
+            Array of shape [n, dims] to write the samples to. If not
+            specified, a new array is allocated.
+        dtype : Optional[numpy.dtype]
+            Floating point type of the samples. Defaults to numpy.float64.
+            Ignored if out is specified.
 
         Returns
         -------
         numpy.ndarray
             Array of samples of shape [n, dims].
         """
-        u = self.u_max * np.random.rand(N)
+        rng = get_rng(rng)
+        u = self.u_max * rng.random(N)
         # Inverse CDF of a chi-distribution
         p = np.sqrt(2 * gammaincinv(0.5 * self.dims, u))
-        x = np.random.randn(self.dims, N)
-        points = (p * x / np.sqrt(np.sum(x**2.0, axis=0))).T
-        return points
+        if isinstance(rng, np.random.Generator):
+            x = _standard_normal(rng, (N, self.dims), out=out, dtype=dtype)
+        else:
+            # Draw the directions in the same order as previous versions so
+            # results with a seeded global random state are unchanged
+            x = _standard_normal(rng, (self.dims, N)).T
+            if out is not None:
+                _check_out_shape(out, x.shape)
+                out[...] = x
+                x = out
+            elif dtype is not None:
+                x = x.astype(dtype, copy=False)
+        r2 = np.einsum("ij,ij->i", x, x)
+        np.multiply(x, (p / np.sqrt(r2))[:, np.newaxis], out=x)
+        return x
@@ -142,6 +142,14 @@ def test_get_optimiser(model, optimiser):
     assert mock.call_args.kwargs["test"] is True
 
 
+def test_dtype(model):
+    """Assert the numpy dtype matches the default torch dtype"""
+    with patch("torch.get_default_dtype", return_value=torch.float64):
+        assert FlowModel.dtype.__get__(model) == np.float64
+    with patch("torch.get_default_dtype", return_value=torch.float32):
+        assert FlowModel.dtype.__get__(model) == np.float32
+
+
 @pytest.mark.parametrize(
     "data_size, batch_size",
     [(4010, 1000), (106, 21), (1000, 1000), (2000, 1000)],
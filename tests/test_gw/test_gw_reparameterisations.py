@@ -44,6 +44,15 @@ def test_get_gw_reparameterisation():
     base_fn.assert_called_once_with("mass_ratio", defaults=default_gw)
 
 
+def test_default_gw_read_only():
+    """Assert the GW defaults and their keyword arguments are read-only"""
+    assert "default" in default_gw
+    with pytest.raises(TypeError):
+        default_gw["new"] = (DistanceReparameterisation, None)
+    with pytest.raises(TypeError):
+        default_gw["distance"][1]["detect_edges"] = False
+
+
 @pytest.mark.integration_test
 def test_get_gw_reparameterisation_integration():
     """Integration test for get_gw_reparameterisation"""
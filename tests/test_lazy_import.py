@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Test the lazy loading of submodules."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import nessai
+
+
+def test_lazy_submodule():
+    """Assert submodules can be accessed as attributes of the package."""
+    assert nessai.flowsampler is importlib.import_module("nessai.flowsampler")
+
+
+def test_lazy_submodule_unknown():
+    """Assert an error is raised for an unknown attribute."""
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_mod'"):
+        nessai.not_a_mod
+
+
+def test_lazy_submodule_dir():
+    """Assert the submodules are listed by dir."""
+    assert "flowsampler" in dir(nessai)
+
+
+@pytest.mark.integration_test
+def test_import_does_not_import_torch():
+    """Assert importing nessai does not import torch."""
+    code = "import sys, nessai; assert 'torch' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
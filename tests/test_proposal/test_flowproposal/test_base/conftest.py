@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from unittest.mock import create_autospec
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,7 +13,7 @@ def map_to_unit_hypercube(request):
 
 @pytest.fixture()
 def proposal():
-    proposal = create_autospec(BaseFlowProposal)
+    proposal = MagicMock(spec=BaseFlowProposal)
     proposal._initialised = False
     proposal.map_to_unit_hypercube = False
     return proposal
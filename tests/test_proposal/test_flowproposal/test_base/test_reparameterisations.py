@@ -1,5 +1,6 @@
 """Test methods related to reparameterisations"""
 
+import copy
 from unittest.mock import MagicMock, Mock, call, patch
 
 import numpy as np
@@ -11,6 +12,7 @@ from nessai.proposal.flowproposal.base import BaseFlowProposal
 from nessai.reparameterisations import (
     NullReparameterisation,
     RescaleToBounds,
+    default_reparameterisations,
     get_reparameterisation,
 )
 
@@ -293,6 +295,31 @@ def test_configure_reparameterisations_dict_reparam(proposal):
     assert proposal._reparameterisation.prime_parameters == ["x_prime", "y"]
 
 
+def test_configure_reparameterisations_inputs_unchanged(proposal):
+    """Assert the defaults and the inputs are not modified when merging the
+    configurations."""
+    proposal.add_default_reparameterisations = MagicMock()
+    proposal.get_reparameterisation = get_reparameterisation
+    proposal.model.bounds = {"x": [-1, 1], "y": [-1, 1]}
+    proposal.model.names = ["x", "y"]
+    proposal.fallback_reparameterisation = None
+    reparameterisations = {
+        "inversion": {"parameters": ["x"], "detect_edges": False},
+        "y": "logit",
+    }
+    expected_inputs = copy.deepcopy(reparameterisations)
+    expected_defaults = {
+        k: (rc, copy.deepcopy(dict(kw)) if kw is not None else None)
+        for k, (rc, kw) in default_reparameterisations.items()
+    }
+    BaseFlowProposal.configure_reparameterisations(
+        proposal, reparameterisations
+    )
+    assert reparameterisations == expected_inputs
+    assert default_reparameterisations == expected_defaults
+    assert proposal._reparameterisation.parameters == ["x", "y"]
+
+
 @pytest.mark.parametrize(
     "parameters",
     [
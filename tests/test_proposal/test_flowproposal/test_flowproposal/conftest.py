@@ -17,4 +17,8 @@ def proposal():
     proposal._initialised = False
     proposal.accumulate_weights = False
     proposal.map_to_unit_hypercube = False
+    proposal.prefetch_latent_draws = False
+    proposal._latent_buffer = None
+    proposal.latent_dtype = None
+    proposal._latent_dtype = None
     return proposal
@@ -23,6 +23,7 @@ def flow_config():
 
 @pytest.mark.parametrize("expansion_fraction", [0.0, 1.0, None])
 @pytest.mark.parametrize("check_acceptance", [False, True])
+@pytest.mark.parametrize("prefetch_latent_draws", [False, True])
 @pytest.mark.integration_test
 @pytest.mark.timeout(30)
 def test_flowproposal_populate(
@@ -31,6 +32,7 @@ def test_flowproposal_populate(
     flow_config,
     expansion_fraction,
     check_acceptance,
+    prefetch_latent_draws,
 ):
     """
     Test the populate method in the FlowProposal class with a range of
@@ -50,6 +52,7 @@ def test_flowproposal_populate(
         check_acceptance=check_acceptance,
         max_radius=1.0,
         constant_volume_mode=False,
+        prefetch_latent_draws=prefetch_latent_draws,
     )
 
     fp.initialise()
@@ -69,10 +72,11 @@ def test_flowproposal_populate(
         "uniform",
     ],
 )
+@pytest.mark.parametrize("latent_dtype", [None, "flow"])
 @pytest.mark.integration_test
 @pytest.mark.timeout(30)
 def test_flowproposal_populate_edge_cases(
-    tmp_path, model, flow_config, latent_prior
+    tmp_path, model, flow_config, latent_prior, latent_dtype
 ):
     """Tests some less common settings for flowproposal"""
     output = tmp_path / "flowproposal"
@@ -89,6 +93,7 @@ def test_flowproposal_populate_edge_cases(
         max_radius=0.1,
         constant_volume_mode=False,
         fallback_reparameterisation=None,
+        latent_dtype=latent_dtype,
     )
 
     fp.initialise()
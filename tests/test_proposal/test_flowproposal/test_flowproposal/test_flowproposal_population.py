@@ -83,6 +83,7 @@ def test_prep_latent_prior_truncated(proposal):
 
     proposal.latent_prior = "truncated_gaussian"
     proposal.dims = 2
+    proposal.drawsize = 10
     proposal.r = 3.0
     proposal.fuzz = 1.2
     dist = MagicMock()
@@ -98,12 +99,14 @@ def test_prep_latent_prior_truncated(proposal):
 
     assert proposal._populate_dist is dist
     assert proposal._draw_func is dist.sample
+    assert proposal._latent_buffer.shape == (10, 2)
 
 
 def test_prep_latent_prior_other(proposal):
     """Assert partial acts as expected"""
     proposal.latent_prior = "gaussian"
     proposal.dims = 2
+    proposal.drawsize = 10
     proposal.r = 3.0
     proposal.fuzz = 1.2
 
@@ -123,6 +126,58 @@ def test_prep_latent_prior_other(proposal):
     assert proposal._draw_func(N=10).shape == (10, 2)
 
 
+def test_prep_latent_prior_reuse_buffer(proposal):
+    """Assert the latent buffer is only reallocated if the shape changes"""
+    proposal.latent_prior = "gaussian"
+    proposal._draw_latent_prior = MagicMock()
+    proposal.dims = 2
+    proposal.drawsize = 10
+    proposal.r = 3.0
+    proposal.fuzz = 1.2
+    buffer = np.empty((10, 2))
+    proposal._latent_buffer = buffer
+    FlowProposal.prep_latent_prior(proposal)
+    assert proposal._latent_buffer is buffer
+    proposal.drawsize = 20
+    FlowProposal.prep_latent_prior(proposal)
+    assert proposal._latent_buffer.shape == (20, 2)
+
+
+def test_prep_latent_prior_prefetch(proposal):
+    """Assert the latent buffer is not used when prefetching draws"""
+    proposal.latent_prior = "gaussian"
+    proposal._draw_latent_prior = MagicMock()
+    proposal.prefetch_latent_draws = True
+    proposal.dims = 2
+    proposal.drawsize = 10
+    proposal.r = 3.0
+    proposal.fuzz = 1.2
+    proposal._latent_buffer = np.empty((10, 2))
+    FlowProposal.prep_latent_prior(proposal)
+    assert proposal._latent_buffer is None
+
+
+@pytest.mark.parametrize(
+    "latent_dtype, expected",
+    [(None, None), ("float32", "float32"), ("flow", np.float32)],
+)
+def test_prep_latent_prior_dtype(proposal, latent_dtype, expected):
+    """Assert the latent dtype is set and used for the buffer"""
+    proposal.latent_prior = "gaussian"
+    proposal._draw_latent_prior = MagicMock()
+    proposal.latent_dtype = latent_dtype
+    proposal.flow = MagicMock()
+    proposal.flow.dtype = np.dtype("float32")
+    proposal.dims = 2
+    proposal.drawsize = 10
+    proposal.r = 3.0
+    proposal.fuzz = 1.2
+    proposal._latent_buffer = np.empty((10, 2))
+    FlowProposal.prep_latent_prior(proposal)
+    assert proposal._latent_dtype == expected
+    assert proposal._latent_buffer.dtype == np.dtype(expected)
+
+
 def test_prep_latent_prior_flow(proposal):
     proposal.latent_prior = "flow"
     proposal.flow = MagicMock()
@@ -139,6 +194,22 @@ def test_draw_latent_prior(proposal):
     assert out == [1, 2]
 
 
+def test_draw_latent_prior_dtype(proposal):
+    proposal._latent_dtype = np.float32
+    proposal._draw_func = MagicMock(return_value=[1, 2])
+    out = FlowProposal.draw_latent_prior(proposal, 2)
+    proposal._draw_func.assert_called_once_with(N=2, dtype=np.float32)
+    assert out == [1, 2]
+
+
+def test_draw_latent_prior_out(proposal):
+    buffer = np.empty((2, 2))
+    proposal._draw_func = MagicMock(return_value=buffer)
+    out = FlowProposal.draw_latent_prior(proposal, 2, out=buffer)
+    proposal._draw_func.assert_called_once_with(N=2, out=buffer)
+    assert out is buffer
+
+
 @pytest.mark.parametrize("check_acceptance", [False, True])
 @pytest.mark.parametrize("indices", [[], [1]])
 @pytest.mark.parametrize("r", [None, 1.0])
@@ -497,6 +568,44 @@ def test_populate_not_initialised(proposal):
     assert "Proposal has not been initialised. " in str(excinfo.value)
 
 
+def test_populate_prefetch_cleanup_on_error(proposal):
+    """Assert the prefetching executor is shut down if populate fails"""
+    proposal.initialised = True
+    proposal.prefetch_latent_draws = True
+    proposal.truncate_log_q = False
+    proposal.use_x_prime_prior = False
+    proposal.drawsize = 5
+    proposal.indices = []
+    proposal.population_dtype = get_dtype(["x", "y"])
+    proposal.get_alt_distribution = MagicMock(return_value=None)
+    proposal.prep_latent_prior = MagicMock()
+    proposal.backward_pass = MagicMock(side_effect=KeyboardInterrupt)
+
+    latent_draws = MagicMock()
+    latent_draws.__next__.return_value = np.zeros((5, 2))
+    executor = MagicMock()
+
+    with (
+        patch(
+            "nessai.proposal.flowproposal.flowproposal.ThreadPoolExecutor",
+            return_value=executor,
+        ) as mock_executor,
+        patch(
+            "nessai.proposal.flowproposal.flowproposal.draw_iter",
+            return_value=latent_draws,
+        ) as mock_draw_iter,
+        pytest.raises(KeyboardInterrupt),
+    ):
+        FlowProposal.populate(proposal, None, n_samples=10, r=1.0)
+
+    mock_executor.assert_called_once_with(max_workers=1)
+    mock_draw_iter.assert_called_once_with(
+        proposal.draw_latent_prior, executor, 5
+    )
+    latent_draws.close.assert_called_once()
+    executor.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+
+
 def test_populate_truncate_log_q(proposal):
     n_dims = 2
     nlive = 8
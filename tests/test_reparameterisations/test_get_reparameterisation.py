@@ -13,6 +13,7 @@ from nessai.reparameterisations import (
     Rescale,
     RescaleToBounds,
     ToCartesian,
+    default_reparameterisations,
     get_reparameterisation,
 )
 
@@ -84,6 +85,7 @@ def test_get_reparameterisation(inputs):
     reparam, kwargs = get_reparameterisation(name)
     assert reparam is expected_class
     assert kwargs == expected_kwargs
+    assert type(kwargs) is dict
 
 
 def test_get_reparameterisation_with_class():
@@ -131,3 +133,27 @@ def test_get_reparameterisation_defaults():
     cls, kwargs = get_reparameterisation("default", defaults=defaults)
     assert cls == "Class"
     assert kwargs == {"x": 2}
+
+
+def test_default_reparameterisations_read_only():
+    """Assert the default reparameterisations cannot be modified."""
+    with pytest.raises(TypeError):
+        default_reparameterisations["new"] = (Rescale, None)
+    with pytest.raises(TypeError):
+        default_reparameterisations["offset"][1]["offset"] = False
+
+
+def test_get_reparameterisation_kwargs_copy():
+    """Assert the returned kwargs do not share state with the defaults."""
+    _, kwargs = get_reparameterisation("offset")
+    kwargs["offset"] = False
+    assert default_reparameterisations["offset"][1] == {"offset": True}
+    _, other = get_reparameterisation("offset")
+    assert other == {"offset": True}
+    assert other is not kwargs
+
+
+def test_get_reparameterisation_defaults_none_class():
+    """Assert an error is raised if the class in the defaults is None."""
+    with pytest.raises(ValueError, match="Unknown reparameterisation"):
+        get_reparameterisation("default", defaults={"default": (None, {})})
@@ -3,7 +3,11 @@
 Test utilities for sampling in the latent space.
 """
 
-from unittest.mock import create_autospec, patch
+import gc
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec, patch
 
 import numpy as np
 import pytest
@@ -11,14 +15,36 @@ from scipy import special, stats
 
 from nessai.utils.sampling import (
     NDimensionalTruncatedGaussian,
+    _cholesky_cache,
+    _get_chi_ppf_interpolant,
+    _get_cholesky_factor,
     compute_radius,
     draw_gaussian,
+    draw_iter,
+    draw_multivariate_gaussian,
     draw_nsphere,
+    draw_nsphere_numba,
     draw_surface_nsphere,
     draw_truncated_gaussian,
+    draw_truncated_gaussian_numba,
+    draw_truncated_gaussian_rejection,
     draw_uniform,
+    get_jumped_rngs,
+    get_rng,
+    get_xp,
 )
 
+# Functions for drawing samples in the latent space and the additional
+# keyword arguments they require
+DRAW_FUNCTIONS = [
+    (draw_surface_nsphere, {}),
+    (draw_nsphere, {}),
+    (draw_uniform, {}),
+    (draw_gaussian, {}),
+    (draw_truncated_gaussian, {"r": 2.0}),
+    (draw_truncated_gaussian_rejection, {"r": 2.0}),
+]
+
 
 def test_compute_radius():
     """Assert compute radius calls the correct function"""
@@ -50,6 +76,62 @@ def test_compute_radius_integration(d, q, r):
     np.testing.assert_almost_equal(r_out, r, decimal=4)
 
 
+@pytest.mark.parametrize("device", [None, "cpu"])
+def test_get_xp_cpu(device):
+    """Assert numpy is used if the device is not a GPU"""
+    assert get_xp(device) is np
+
+
+def test_get_xp_cuda():
+    """Assert cupy is used if the device is a GPU"""
+    cupy = MagicMock()
+    with patch.dict(sys.modules, {"cupy": cupy}):
+        assert get_xp("cuda:0") is cupy
+
+
+def test_get_xp_cuda_no_cupy():
+    """Assert numpy is used if cupy is not installed"""
+    with patch.dict(sys.modules, {"cupy": None}):
+        assert get_xp("cuda") is np
+
+
+def test_get_rng_xp():
+    """Assert the global random state of the array namespace is used"""
+    xp = MagicMock()
+    assert get_rng(xp=xp) is xp.random
+
+
+def test_get_rng_default():
+    """Assert the global numpy random state is used by default"""
+    assert get_rng() is np.random
+
+
+def test_get_rng():
+    """Assert the generator is returned if specified"""
+    rng = np.random.default_rng(1234)
+    assert get_rng(rng) is rng
+
+
+def test_get_jumped_rngs():
+    """Assert the generators produce independent streams"""
+    rngs = get_jumped_rngs(3, rng=np.random.default_rng(1234))
+    assert len(rngs) == 3
+    assert all(isinstance(rng, np.random.Generator) for rng in rngs)
+    x = [rng.random(10) for rng in rngs]
+    assert not np.array_equal(x[0], x[1])
+    assert not np.array_equal(x[1], x[2])
+
+
+def test_get_jumped_rngs_reproducible():
+    """Assert the streams are seeded from the global random state"""
+    with patch("numpy.random.randint", return_value=1234) as mock:
+        x = get_jumped_rngs(2)[1].random(10)
+        y = get_jumped_rngs(2)[1].random(10)
+    assert mock.call_count == 2
+    mock.assert_called_with(0, min(np.iinfo(int).max, 2**32 - 1))
+    np.testing.assert_array_equal(x, y)
+
+
 @pytest.mark.parametrize("ndims, radius", [(2, 1), (10, 2), (10, 10), (1, 1)])
 def test_draw_surface_nsphere(ndims, radius):
     """
@@ -76,6 +158,21 @@ def test_draw_nball(ndims, radius):
     np.testing.assert_array_less(np.sqrt(np.sum(out**2, axis=-1)), radius)
 
 
+@pytest.mark.parametrize("ndims", [1, 2, 5])
+def test_draw_nball_uniform_volume(ndims):
+    """Assert the samples are distributed uniformly within the n-ball.
+
+    The fraction of the volume enclosed by the radius of each sample should
+    be uniformly distributed.
+    """
+    radius, fuzz = 2.0, 1.5
+    rng = np.random.default_rng(1234)
+    out = draw_nsphere(ndims, r=radius, N=2000, fuzz=fuzz, rng=rng)
+    r = np.sqrt(np.sum(out**2, axis=-1))
+    _, p = stats.kstest((r / (radius * fuzz)) ** ndims, "uniform")
+    assert p >= 0.05
+
+
 def test_draw_uniform():
     """Assert the underlying numpy function is called correctly."""
     expected = np.array([0.5, 1])
@@ -85,15 +182,175 @@ def test_draw_uniform():
     np.testing.assert_array_equal(out, expected)
 
 
+def test_draw_uniform_rng():
+    """Assert the random number generator is used if specified."""
+    expected = np.array([0.5, 1])
+    rng = MagicMock(spec=np.random.Generator)
+    rng.uniform.return_value = expected
+    out = draw_uniform(2, r=1, N=100, fuzz=2, rng=rng)
+    rng.uniform.assert_called_once_with(0, 1, (100, 2))
+    np.testing.assert_array_equal(out, expected)
+
+
 def test_draw_gaussian():
     """Assert the underlying numpy function is called correctly."""
     expected = np.array([1, 2])
-    with patch("numpy.random.randn", return_value=expected) as mock:
+    with patch("numpy.random.standard_normal", return_value=expected) as mock:
         out = draw_gaussian(2, r=1, N=100, fuzz=2)
-    mock.assert_called_once_with(100, 2)
+    mock.assert_called_once_with((100, 2))
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_draw_gaussian_rng():
+    """Assert the random number generator is used if specified."""
+    expected = np.array([1, 2])
+    rng = MagicMock(spec=np.random.Generator)
+    rng.standard_normal.return_value = expected
+    out = draw_gaussian(2, r=1, N=100, fuzz=2, rng=rng)
+    rng.standard_normal.assert_called_once_with((100, 2))
     np.testing.assert_array_equal(out, expected)
 
 
+@pytest.mark.parametrize("method", ["cholesky", "svd", "eigh"])
+def test_draw_multivariate_gaussian(method):
+    """Assert the samples have the correct mean and covariance"""
+    mean = np.array([1.0, -2.0, 0.5])
+    cov = np.array([[2.0, 0.5, 0.1], [0.5, 1.0, -0.3], [0.1, -0.3, 0.5]])
+    rng = np.random.default_rng(1234)
+    x = draw_multivariate_gaussian(
+        mean, cov, N=100_000, rng=rng, method=method
+    )
+    assert x.shape == (100_000, 3)
+    np.testing.assert_allclose(x.mean(axis=0), mean, atol=0.02)
+    np.testing.assert_allclose(np.cov(x.T), cov, atol=0.03)
+
+
+def test_draw_multivariate_gaussian_cholesky_cached():
+    """Assert the Cholesky factor is only computed once per array"""
+    cov = np.array([[2.0, 0.5], [0.5, 1.0]])
+    with patch(
+        "numpy.linalg.cholesky", side_effect=np.linalg.cholesky
+    ) as mock:
+        draw_multivariate_gaussian(np.zeros(2), cov, N=10)
+        draw_multivariate_gaussian(np.zeros(2), cov, N=10)
+    mock.assert_called_once_with(cov)
+
+
+@pytest.mark.parametrize("method", ["svd", "eigh"])
+def test_draw_multivariate_gaussian_method_no_rng(method):
+    """Assert other methods can be used without specifying the rng"""
+    cov = np.array([[2.0, 0.5], [0.5, 1.0]])
+    with patch("numpy.random.randint", return_value=1234) as mock:
+        x = draw_multivariate_gaussian(np.zeros(2), cov, N=10, method=method)
+    mock.assert_called_once_with(0, min(np.iinfo(int).max, 2**32 - 1))
+    y = draw_multivariate_gaussian(
+        np.zeros(2), cov, N=10, rng=np.random.default_rng(1234), method=method
+    )
+    np.testing.assert_array_equal(x, y)
+
+
+def test_cholesky_factor_modified_in_place():
+    """Assert the factor is recomputed if the covariance is modified"""
+    cov = np.array([[2.0, 0.5], [0.5, 1.0]])
+    L = _get_cholesky_factor(cov)
+    cov *= 4
+    L_new = _get_cholesky_factor(cov)
+    np.testing.assert_allclose(L_new, 2 * L)
+    np.testing.assert_allclose(L_new @ L_new.T, cov)
+
+
+def test_cholesky_factor_cache_cleared():
+    """Assert the cached factor is removed when the array is deleted"""
+    cov = np.array([[2.0, 0.5], [0.5, 1.0]])
+    _get_cholesky_factor(cov)
+    key = id(cov)
+    assert key in _cholesky_cache
+    del cov
+    gc.collect()
+    assert key not in _cholesky_cache
+
+
+def test_draw_multivariate_gaussian_cholesky_list():
+    """Assert covariance matrices that cannot be cached are supported"""
+    x = draw_multivariate_gaussian([0.0, 0.0], [[1.0, 0.0], [0.0, 1.0]], N=10)
+    assert x.shape == (10, 2)
+
+
+@pytest.mark.parametrize("func, kwargs", DRAW_FUNCTIONS)
+def test_draw_functions_rng_reproducible(func, kwargs):
+    """Assert the draw functions are reproducible with a generator"""
+    x = func(4, N=10, rng=np.random.default_rng(1234), **kwargs)
+    y = func(4, N=10, rng=np.random.default_rng(1234), **kwargs)
+    np.testing.assert_array_equal(x, y)
+
+
+@pytest.mark.parametrize("dims", [1, 2, 8, 64])
+@pytest.mark.parametrize("r_max", [1.0, 4.0, 12.0])
+def test_chi_ppf_interpolant(dims, r_max):
+    """Assert the interpolant agrees with the inverse CDF"""
+    ppf, u_max = _get_chi_ppf_interpolant(dims, r_max)
+    np.testing.assert_allclose(u_max, stats.chi.cdf(r_max, df=dims))
+    # The final node is clipped to the radius where the CDF saturates
+    r_sat = np.sqrt(2 * special.gammaincinv(dims / 2, 1 - 1e-15))
+    np.testing.assert_allclose(ppf(u_max), min(r_max, r_sat))
+    # Exclude the end point since the tail is not resolved by the interpolant
+    u = np.linspace(0, u_max, 1000)[:-1]
+    np.testing.assert_allclose(
+        ppf(u), stats.chi.ppf(u, df=dims), rtol=1e-4, atol=1e-4
+    )
+
+
+@pytest.mark.parametrize("dims", [1, 2, 8])
+def test_chi_ppf_interpolant_large_radius(dims):
+    """Assert the interpolant is accurate when the radius is large"""
+    ppf, u_max = _get_chi_ppf_interpolant(dims, 50.0)
+    assert np.isfinite(ppf(u_max))
+    assert ppf(u_max) <= 50.0
+    u = np.concatenate(
+        [np.geomspace(1e-12, 1e-3, 100), np.linspace(0, 0.99, 100)]
+    )
+    np.testing.assert_allclose(ppf(u), stats.chi.ppf(u, df=dims), atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        draw_truncated_gaussian,
+        pytest.param(
+            draw_truncated_gaussian_numba, marks=pytest.mark.requires("numba")
+        ),
+    ],
+)
+def test_draw_truncated_gaussian_zero_radius(func):
+    """Assert all of the samples are at the origin if the radius is zero"""
+    x = func(4, 0.0, N=10, rng=np.random.default_rng(1234))
+    np.testing.assert_array_equal(x, np.zeros((10, 4)))
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        draw_truncated_gaussian,
+        pytest.param(
+            draw_truncated_gaussian_numba, marks=pytest.mark.requires("numba")
+        ),
+    ],
+)
+@pytest.mark.parametrize("dims", [1, 4])
+def test_draw_truncated_gaussian_infinite_radius(func, dims):
+    """Assert samples can be drawn without a truncation"""
+    x = func(dims, np.inf, N=2000, rng=np.random.default_rng(1234))
+    assert x.shape == (2000, dims)
+    assert np.isfinite(x).all()
+    _, p = stats.kstest(np.linalg.norm(x, axis=1), stats.chi(dims).cdf)
+    assert p >= 0.05
+
+
+def test_chi_ppf_interpolant_cached():
+    """Assert the interpolant is only computed once"""
+    assert _get_chi_ppf_interpolant(4, 3.0) is _get_chi_ppf_interpolant(4, 3.0)
+
+
 @pytest.mark.parametrize(
     "r, var, fuzz",
     [
@@ -118,6 +375,278 @@ def test_draw_truncated_gaussian_1d(r, var, fuzz):
     assert p >= 0.05
 
 
+def test_draw_truncated_gaussian_xp():
+    """Assert the radii are moved to the host and back for other array
+    namespaces.
+    """
+    xp = SimpleNamespace(
+        asarray=MagicMock(side_effect=np.asarray),
+        asnumpy=MagicMock(side_effect=np.asarray),
+        einsum=np.einsum,
+        multiply=np.multiply,
+        sqrt=np.sqrt,
+    )
+    x = draw_truncated_gaussian(
+        3, 2.0, N=10, rng=np.random.default_rng(1234), xp=xp
+    )
+    xp.asnumpy.assert_called_once()
+    xp.asarray.assert_called_once()
+    assert x.shape == (10, 3)
+    np.testing.assert_array_less(np.linalg.norm(x, axis=1), 2.0 + 1e-12)
+    expected = draw_truncated_gaussian(
+        3, 2.0, N=10, rng=np.random.default_rng(1234)
+    )
+    np.testing.assert_array_equal(x, expected)
+
+
+@pytest.mark.parametrize(
+    "r, var, fuzz",
+    [
+        (1.0, 1.0, 1.0),
+        (2.0, 2.0, 1.0),
+        (4.0, 2.0, 1.5),
+    ],
+)
+def test_draw_truncated_gaussian_rejection_1d(r, var, fuzz):
+    """Test drawing from a truncated Gaussian in 1d with rejection sampling"""
+    rng = np.random.default_rng(1)
+    s = draw_truncated_gaussian_rejection(
+        1, r, var=var, N=2000, fuzz=fuzz, rng=rng
+    )
+    assert s.shape == (2000, 1)
+    sigma = np.sqrt(var)
+    d = stats.truncnorm(
+        -r * fuzz / sigma, r * fuzz / sigma, loc=0, scale=sigma
+    )
+    _, p = stats.kstest(np.squeeze(s), d.cdf)
+    assert p >= 0.05
+
+
+def test_draw_truncated_gaussian_rejection_radii():
+    """Assert the radii follow a truncated chi-distribution"""
+    dims, r_max = 4, 2.0
+    rng = np.random.default_rng(1)
+    x = draw_truncated_gaussian_rejection(dims, r_max, N=2000, rng=rng)
+    r = np.linalg.norm(x, axis=1)
+    cdf_max = stats.chi.cdf(r_max, dims)
+    _, p = stats.kstest(r, lambda v: stats.chi.cdf(v, dims) / cdf_max)
+    assert p >= 0.05
+
+
+def test_draw_truncated_gaussian_rejection_regrow():
+    """Assert more samples are drawn if the first batch is not sufficient"""
+    rng = np.random.default_rng(1234)
+    with patch(
+        "nessai.utils.sampling._get_truncated_gaussian_acceptance",
+        return_value=1.0,
+    ):
+        x = draw_truncated_gaussian_rejection(4, 1.0, N=100, rng=rng)
+    assert x.shape == (100, 4)
+    assert (np.linalg.norm(x, axis=1) <= 1.0).all()
+
+
+@pytest.mark.parametrize("dims, r", [(64, 1.0), (16, 2.0)])
+def test_draw_truncated_gaussian_rejection_low_acceptance(dims, r):
+    """Assert inverse CDF sampling is used if the acceptance is too low"""
+    rng = np.random.default_rng(1234)
+    with patch(
+        "nessai.utils.sampling.draw_truncated_gaussian",
+        side_effect=draw_truncated_gaussian,
+    ) as mock:
+        x = draw_truncated_gaussian_rejection(dims, r, N=10, rng=rng)
+    mock.assert_called_once_with(
+        dims, r, N=10, fuzz=1.0, var=1, rng=rng, out=None, dtype=None
+    )
+    assert x.shape == (10, dims)
+    assert (np.linalg.norm(x, axis=1) <= r).all()
+
+
+def test_draw_truncated_gaussian_rejection_max_batch_size():
+    """Assert the number of radii drawn per batch is limited"""
+    rng = MagicMock(wraps=np.random.default_rng(1234))
+    x = draw_truncated_gaussian_rejection(
+        2, 2.0, N=100, rng=rng, max_batch_size=20
+    )
+    assert x.shape == (100, 2)
+    assert rng.chisquare.call_count > 1
+    assert all(c.args[1] <= 20 for c in rng.chisquare.call_args_list)
+
+
+def test_draw_truncated_gaussian_rejection_zero_radius():
+    """Assert an error is raised if no samples can be accepted"""
+    with pytest.raises(ValueError, match=r"Acceptance rate is zero"):
+        draw_truncated_gaussian_rejection(2, 0.0, N=10)
+
+
+@pytest.mark.parametrize("func, kwargs", DRAW_FUNCTIONS)
+@pytest.mark.parametrize("use_generator", [False, True])
+def test_draw_functions_out(func, kwargs, use_generator):
+    """Assert the samples are written to the output array"""
+    rng = np.random.default_rng(1234) if use_generator else None
+    out = np.empty((10, 4))
+    x = func(4, N=10, rng=rng, out=out, **kwargs)
+    assert x is out
+    assert np.isfinite(out).all()
+
+
+@pytest.mark.parametrize(
+    "func, kwargs",
+    DRAW_FUNCTIONS
+    + [
+        (draw_nsphere_numba, {}),
+        (draw_truncated_gaussian_numba, {"r": 2.0}),
+    ],
+)
+def test_draw_functions_out_invalid_shape(func, kwargs):
+    """Assert an error is raised if the output array has the wrong shape"""
+    with patch("nessai.utils._sampling_numba.NUMBA_AVAILABLE", True):
+        with pytest.raises(ValueError, match=r"Output array has shape"):
+            func(4, N=10, out=np.empty((5, 4)), **kwargs)
+
+
+@pytest.mark.parametrize(
+    "func, kwargs",
+    [(f, k) for f, k in DRAW_FUNCTIONS if f is not draw_surface_nsphere],
+)
+@pytest.mark.parametrize("use_generator", [False, True])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_draw_functions_dtype(func, kwargs, use_generator, dtype):
+    """Assert the samples have the requested dtype"""
+    rng = np.random.default_rng(1234) if use_generator else None
+    x = func(4, N=10, rng=rng, dtype=dtype, **kwargs)
+    assert x.dtype == dtype
+    assert np.isfinite(x).all()
+
+
+@pytest.mark.parametrize("func, kwargs", DRAW_FUNCTIONS)
+def test_draw_functions_out_float32(func, kwargs):
+    """Assert single precision output arrays are supported"""
+    out = np.empty((10, 4), dtype=np.float32)
+    x = func(4, N=10, rng=np.random.default_rng(1234), out=out, **kwargs)
+    assert x is out
+
+
+def test_draw_nsphere_float32_in_bounds():
+    """Assert single precision samples are within the n-ball"""
+    x = draw_nsphere(4, r=2.0, N=1000, dtype=np.float32)
+    assert x.dtype == np.float32
+    assert (np.linalg.norm(x, axis=1) <= 2.0 * (1 + 1e-6)).all()
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_ndimensional_truncated_gaussian_sample_dtype(dtype):
+    """Assert the samples have the requested dtype"""
+    dist = NDimensionalTruncatedGaussian(4, 2.0)
+    assert dist.sample(10, dtype=dtype).dtype == dtype
+
+
+def test_ndimensional_truncated_gaussian_sample_out():
+    """Assert samples are written to the output array"""
+    dist = NDimensionalTruncatedGaussian(4, 2.0)
+    out = np.empty((10, 4))
+    assert dist.sample(10, out=out) is out
+
+
+@pytest.mark.parametrize("use_out", [False, True])
+def test_ndimensional_truncated_gaussian_sample_global_state(use_out):
+    """Assert samples drawn with the global random state are unchanged"""
+    dims, N = 4, 10
+    dist = NDimensionalTruncatedGaussian(dims, 2.0, fuzz=1.5)
+    np.random.seed(1234)
+    u = dist.u_max * np.random.rand(N)
+    p = np.sqrt(2 * special.gammaincinv(0.5 * dims, u))
+    x = np.random.randn(dims, N)
+    expected = (p * x / np.sqrt(np.sum(x**2.0, axis=0))).T
+
+    out = np.empty((N, dims)) if use_out else None
+    np.random.seed(1234)
+    samples = dist.sample(N, out=out)
+    np.testing.assert_allclose(samples, expected, rtol=1e-12)
+
+
+@pytest.mark.cuda
+@pytest.mark.requires("cupy")
+@pytest.mark.parametrize(
+    "func, kwargs",
+    [
+        (f, k)
+        for f, k in DRAW_FUNCTIONS
+        if f in (draw_nsphere, draw_gaussian, draw_truncated_gaussian)
+    ],
+)
+def test_draw_functions_cupy(func, kwargs):
+    """Assert the samples are drawn on the GPU when using cupy"""
+    import cupy
+
+    out = func(4, N=10, xp=cupy, **kwargs)
+    assert isinstance(out, cupy.ndarray)
+    assert out.shape == (10, 4)
+
+
+@pytest.mark.requires("numba")
+@pytest.mark.parametrize("ndims, radius", [(2, 1), (10, 2), (1, 1)])
+def test_draw_nball_numba(ndims, radius):
+    """Assert the numba version returns samples within the n-ball."""
+    out = draw_nsphere_numba(ndims, r=radius, N=1000, fuzz=1.5)
+    assert out.shape == (1000, ndims)
+    np.testing.assert_array_less(
+        np.sqrt(np.sum(out**2, axis=-1)), 1.5 * radius
+    )
+
+
+@pytest.mark.requires("numba")
+@pytest.mark.parametrize("r, var, fuzz", [(2.0, 1.0, 1.0), (4.0, 2.0, 1.5)])
+@pytest.mark.flaky(reruns=5)
+def test_draw_truncated_gaussian_numba_1d(r, var, fuzz):
+    """Assert the numba version draws from the truncated Gaussian in 1d"""
+    s = draw_truncated_gaussian_numba(1, r, var=var, N=2000, fuzz=fuzz)
+    sigma = np.sqrt(var)
+    d = stats.truncnorm(
+        -r * fuzz / sigma, r * fuzz / sigma, loc=0, scale=sigma
+    )
+    _, p = stats.kstest(np.squeeze(s), d.cdf)
+    assert p >= 0.05
+
+
+@pytest.mark.parametrize(
+    "func", [draw_nsphere_numba, draw_truncated_gaussian_numba]
+)
+def test_draw_numba_not_installed(func):
+    """Assert an error is raised if numba is not installed"""
+    with patch("nessai.utils._sampling_numba.NUMBA_AVAILABLE", False):
+        with pytest.raises(RuntimeError, match="numba is not installed"):
+            func(2, r=1.0, N=10)
+
+
+def test_draw_iter():
+    """Assert the next batch is submitted before the current is returned"""
+
+    def submit(func, *args, **kwargs):
+        future = MagicMock()
+        future.result.return_value = func(*args, **kwargs)
+        return future
+
+    draw_func = MagicMock(side_effect=[1, 2, 3])
+    executor = MagicMock()
+    executor.submit.side_effect = submit
+    batches = draw_iter(draw_func, executor, 4, fuzz=1.5)
+    assert next(batches) == 1
+    assert next(batches) == 2
+    assert draw_func.call_count == 3
+    draw_func.assert_called_with(4, fuzz=1.5)
+    batches.close()
+
+
+@pytest.mark.integration_test
+def test_draw_iter_integration():
+    """Assert batches are drawn using a thread pool"""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        batches = draw_iter(draw_gaussian, executor, 2, N=10)
+        for _ in range(3):
+            assert next(batches).shape == (10, 2)
+        batches.close()
+
+
 @pytest.mark.parametrize("dims", [1, 2, 4, 8, 16, 32, 64])
 @pytest.mark.parametrize("radius", [1.0, 2.0, 4.0])
 @pytest.mark.parametrize("fuzz", [1.0, 1.1, 1.5])